@@ -8,7 +8,10 @@ echo "Starting parent forwarder script..."
 
 # Start Sui CLI proxy service
 echo "Starting Sui CLI proxy service on port 9999..."
-python3 sui_proxy.py &
+# Single async worker: caches, JWT refresh, gas single-flight and the CLI
+# process cap are all per-process state
+gunicorn sui_proxy:app -b 0.0.0.0:9999 -k uvicorn.workers.UvicornWorker \
+    --workers 1 --keep-alive 75 --timeout 120 &
 SUI_PROXY_PID=$!
 echo "Sui proxy started with PID: $SUI_PROXY_PID"
 
@@ -80,6 +80,8 @@ pub struct VerificationProcessor {
     registry_id: String,
     cap_id: String,
     clock_id: String,
+    // Shared HTTP client so connections to the Sui proxy are kept alive
+    sui_proxy_client: reqwest::Client,
     // Redis authentication
     redis_username: String,
     redis_password: String,
@@ -134,6 +136,7 @@ impl VerificationProcessor {
                 .unwrap_or_else(|_| "0x9aa20287121e2d325405097c54b5a2519a5d3f745ca74d47358a490dc94914cc".to_string()),
             clock_id: std::env::var("SUI_CLOCK_ID")
                 .unwrap_or_else(|_| "0x0000000000000000000000000000000000000000000000000000000000000006".to_string()),
+            sui_proxy_client: reqwest::Client::new(),
             redis_username,
             redis_password,
         })
@@ -426,8 +429,7 @@ impl VerificationProcessor {
             "gas_budget": "10000000"
         });
 
-        let client = reqwest::Client::new();
-        let response = client
+        let response = self.sui_proxy_client
             .post("http://localhost:9999/sui/client/call")
             .json(&call_data)
             .send()
@@ -440,8 +442,11 @@ impl VerificationProcessor {
             let output_str = result["stdout"].as_str().unwrap_or("");
             info!("Output: {}", output_str);
             
-            // Extract UserDID object ID from the transaction output using the same logic as redis_sui_processor
-            if let Some(user_did_id) = self.extract_user_did_id(output_str) {
+            // Extract UserDID object ID from the JSON transaction response when the proxy
+            // returns one, otherwise from the CLI text output (same logic as redis_sui_processor)
+            let user_did_id = self.extract_user_did_id_from_json(&result["stdout_json"])
+                .or_else(|| self.extract_user_did_id(output_str));
+            if let Some(user_did_id) = user_did_id {
                 info!("Extracted UserDID ID: {}", user_did_id);
                 return Ok(Some(user_did_id));
             } else {
@@ -494,8 +499,7 @@ impl VerificationProcessor {
             "gas_budget": "10000000"
         });
 
-        let client = reqwest::Client::new();
-        let response = client
+        let response = self.sui_proxy_client
             .post("http://localhost:9999/sui/client/call")
             .json(&call_data)
             .send()
@@ -515,6 +519,24 @@ impl VerificationProcessor {
         Ok(())
     }
 
+    /// Extract UserDID object ID from the `objectChanges` of a JSON transaction response
+    fn extract_user_did_id_from_json(&self, response: &serde_json::Value) -> Option<String> {
+        response["objectChanges"]
+            .as_array()?
+            .iter()
+            .find(|change| {
+                change["type"] == "created"
+                    && change["objectType"]
+                        .as_str()
+                        .map_or(false, |t| t.contains("::did_registry::UserDID"))
+            })
+            .and_then(|change| change["objectId"].as_str())
+            .map(|object_id| {
+                info!("Found UserDID object: {}", object_id);
+                object_id.to_string()
+            })
+    }
+
     /// Extract UserDID object ID from Sui transaction output (replicated from redis_sui_processor.rs)
     fn extract_user_did_id(&self, output: &str) -> Option<String> {
         let lines: Vec<&str> = output.lines().collect();
@@ -3,172 +3,468 @@
 Sui CLI Proxy Services
 Runs on the host and provides HTTP API for Sui CLI calls from the enclave
 
-Requirements: pip install flask python-dotenv requests
+Requirements: pip install quart uvicorn gunicorn httpx orjson python-dotenv pyyaml cryptography
 """
 
-from flask import Flask, request, jsonify
+from quart import Quart, Response, request, jsonify
+from quart.json.provider import DefaultJSONProvider
+import asyncio
 import subprocess
 import json
 import logging
 import os
-import requests
+import re
+import shutil
+import time
+import weakref
+import httpx
+import orjson
 from datetime import datetime, timedelta
+from itertools import chain
 from dotenv import load_dotenv
+from sui_rpc import SuiRpcClient, SuiRpcError, gas_coin_summary, to_sui_json
 
-app = Flask(__name__)
+def dumps_json(obj):
+    """Serialize to JSON bytes with orjson, falling back to json for wide integers"""
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        # orjson rejects integers beyond 64 bits (u128/u256 values in CLI output)
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider encoding with orjson, which is much faster on large CLI/RPC payloads.
+
+    Decoding stays on the stdlib parser: orjson turns integers wider than
+    64 bits into floats, which would corrupt u128/u256 call arguments.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return dumps_json(obj).decode()
+
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes straight to the response without a str round trip
+        obj = args[0] if len(args) == 1 else (args or kwargs)
+        return json_response(dumps_json(obj))
+
+JSON_MIMETYPE = 'application/json'
+
+def json_response(data, status=200):
+    """Wrap already-serialized JSON bytes in a response"""
+    return Response(data, status=status, mimetype=JSON_MIMETYPE)
+
+app = Quart(__name__)
+app.json = ORJSONProvider(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Load environment variables from .env file at import time so they are
+# available no matter how the app is served (uvicorn, python3 sui_proxy.py)
+ENV_FILE = os.path.join(os.path.dirname(__file__), 'src', 'attestation-backend', '.env')
+if os.path.exists(ENV_FILE):
+    load_dotenv(ENV_FILE)
+
+# Shared async HTTP client for the government API and the Sui fullnode so
+# TCP/TLS connections are kept alive and reused across requests. Pool limits
+# belong on the transport (httpx ignores client-level limits when one is given);
+# retries cover connection failures only, all our upstream calls are POSTs
+HTTP_CLIENT = httpx.AsyncClient(
+    timeout=60,
+    headers={'accept': 'application/json'},
+    transport=httpx.AsyncHTTPTransport(
+        retries=3,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+)
+
+# Talk to the Sui fullnode over JSON-RPC unless SUI_USE_CLI is set; the sui CLI
+# subprocess path is kept as a fallback
+SUI_USE_CLI = os.getenv('SUI_USE_CLI', 'false').lower() in ('1', 'true', 'yes')
+sui_rpc = None
+
+# Include the full CLI command line in responses, for debugging only
+SUI_PROXY_DEBUG = os.getenv('SUI_PROXY_DEBUG', 'false').lower() in ('1', 'true', 'yes')
+
+# Resolve the sui binary once instead of searching PATH on every exec
+SUI_BIN = os.getenv('SUI_BIN') or shutil.which('sui') or 'sui'
+
+# Caps concurrent sui CLI processes so request bursts cannot fork-storm the host
+CLI_SLOTS = asyncio.Semaphore(min(32, (os.cpu_count() or 1) * 4))
+
+async def run_cli(cmd, timeout):
+    """Run a Sui CLI command without blocking the event loop, capturing raw bytes"""
+    async with CLI_SLOTS:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        finally:
+            # Also runs when the handler is cancelled (client disconnect), so the
+            # child is reaped before its CLI slot is released
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+def decode_output(output):
+    """Decode captured CLI output once, replacing invalid UTF-8"""
+    return output.decode('utf-8', 'replace').strip()
+
+def cli_json_body(result):
+    """Build a response body from a `--json` CLI invocation, parsing stdout once"""
+    stdout_json = None
+    if result.returncode == 0:
+        try:
+            # json.loads accepts bytes, so stdout is never decoded to str on success
+            stdout_json = json.loads(result.stdout)
+        except ValueError:
+            logger.warning("Sui CLI returned non-JSON output")
+    return {
+        'success': result.returncode == 0,
+        'stdout': '' if stdout_json is not None else decode_output(result.stdout),
+        'stdout_json': stdout_json,
+        'stderr': decode_output(result.stderr),
+        'returncode': result.returncode
+    }
+
+# Health check body never changes, so it is serialized once at import
+HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "sui-proxy"})
+
 @app.route('/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "service": "sui-proxy"})
+    return json_response(HEALTH_BYTES)
+
+# Cached Sui responses, stored serialized so hits skip JSON encoding:
+# key -> (response bytes, expires_at or None for never)
+sui_cache = {}
+GAS_CACHE_TTL = 3  # seconds
+
+def cache_get(key):
+    """Return cached response bytes if present and not expired"""
+    entry = sui_cache.get(key)
+    if entry and (entry[1] is None or time.monotonic() < entry[1]):
+        return entry[0]
+    return None
+
+def cache_set(key, body, ttl=None):
+    """Serialize and cache a response body, forever when no ttl is given"""
+    data = dumps_json(body)
+    sui_cache[key] = (data, time.monotonic() + ttl if ttl is not None else None)
+    return data
+
+async def fetch_active_address():
+    """Look up the active Sui address, caching it for the process lifetime"""
+    if sui_rpc:
+        body = {
+            'success': True,
+            'stdout': sui_rpc.address,
+            'stderr': '',
+            'returncode': 0
+        }
+    else:
+        result = await run_cli([SUI_BIN, 'client', 'active-address'], timeout=10)
+        body = {
+            'success': result.returncode == 0,
+            'stdout': decode_output(result.stdout),
+            'stderr': decode_output(result.stderr),
+            'returncode': result.returncode
+        }
+    if body['success']:
+        cache_set('active_address', body)
+    return body
 
 @app.route('/sui/client/active-address', methods=['GET'])
-def get_active_address():
+async def get_active_address():
     """Get the active Sui address"""
     try:
-        result = subprocess.run(['sui', 'client', 'active-address'], 
-                              capture_output=True, text=True, timeout=10)
-        return jsonify({
-            'success': result.returncode == 0,
-            'stdout': result.stdout.strip(),
-            'stderr': result.stderr.strip(),
-            'returncode': result.returncode
-        })
+        cached = cache_get('active_address')
+        if cached:
+            return json_response(cached)
+        return jsonify(await fetch_active_address())
     except Exception as e:
         logger.error(f"Error getting active address: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Gas lookup currently in progress; concurrent requests await it instead of
+# starting their own (single-flight)
+_gas_inflight = None
+
+async def fetch_gas():
+    """Look up gas coins, caching successful responses for GAS_CACHE_TTL"""
+    if sui_rpc:
+        coins = await sui_rpc.get_coins()
+        body = {
+            'success': True,
+            'stdout': '',
+            'stdout_json': [gas_coin_summary(coin) for coin in coins],
+            'stderr': '',
+            'returncode': 0
+        }
+    else:
+        result = await run_cli([SUI_BIN, 'client', 'gas', '--json'], timeout=10)
+        body = cli_json_body(result)
+    
+    # Only the current lookup may fill the cache; /admin/refresh drops older ones
+    if body['success'] and asyncio.current_task() is _gas_inflight:
+        return cache_set('gas', body, GAS_CACHE_TTL)
+    return dumps_json(body)
+
 @app.route('/sui/client/gas', methods=['GET'])
-def get_gas():
-    """Get gas coins"""
+async def get_gas():
+    """Get gas coins, cached for a few seconds unless ?fresh=1 is passed"""
+    global _gas_inflight
+    
     try:
-        result = subprocess.run(['sui', 'client', 'gas'], 
-                              capture_output=True, text=True, timeout=10)
-        return jsonify({
-            'success': result.returncode == 0,
-            'stdout': result.stdout.strip(),
-            'stderr': result.stderr.strip(),
-            'returncode': result.returncode
-        })
+        fresh = request.args.get('fresh') == '1'
+        if not fresh:
+            cached = cache_get('gas')
+            if cached:
+                return json_response(cached)
+        
+        if fresh or _gas_inflight is None or _gas_inflight.done():
+            _gas_inflight = asyncio.ensure_future(fetch_gas())
+        # Shield the shared lookup so one disconnecting client cannot cancel it for the rest
+        return json_response(await asyncio.shield(_gas_inflight))
     except Exception as e:
         logger.error(f"Error getting gas: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/admin/refresh', methods=['POST'])
+async def admin_refresh():
+    """Drop cached Sui responses and reload the Sui config"""
+    global sui_rpc, _gas_inflight
+    
+    sui_cache.clear()
+    _gas_inflight = None
+    try:
+        if sui_rpc:
+            sui_rpc = SuiRpcClient.from_config(HTTP_CLIENT)
+        await fetch_active_address()
+        return jsonify({'success': True})
+    except Exception as e:
+        logger.error(f"Error refreshing Sui state: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+# Shape checks for contract calls, so malformed requests never reach the CLI/RPC
+# (used with fullmatch, so a trailing newline does not slip through)
+PACKAGE_ID_RE = re.compile(r'0x[0-9a-fA-F]{1,64}')
+IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+GAS_BUDGET_RE = re.compile(r'[0-9]+')
+
+def call_request_error(package_id, module, function, gas_budget, args, type_args):
+    """Return why a contract call request is malformed, or None if it looks valid"""
+    if not isinstance(package_id, str) or not PACKAGE_ID_RE.fullmatch(package_id):
+        return 'package_id must be a 0x-prefixed hex object ID'
+    if not isinstance(module, str) or not IDENTIFIER_RE.fullmatch(module):
+        return 'module must be a Move identifier'
+    if not isinstance(function, str) or not IDENTIFIER_RE.fullmatch(function):
+        return 'function must be a Move identifier'
+    if not GAS_BUDGET_RE.fullmatch(gas_budget):
+        return 'gas_budget must be a non-negative integer'
+    if not isinstance(args, list) or not isinstance(type_args, list):
+        return 'args and type_args must be lists'
+    if not all(isinstance(type_arg, str) for type_arg in type_args):
+        return 'type_args must be strings'
+    return None
+
+def ptb_request_error(gas_budget, commands):
+    """Return why a PTB request is malformed, or None if it looks valid"""
+    if not GAS_BUDGET_RE.fullmatch(gas_budget):
+        return 'gas_budget must be a non-negative integer'
+    if not isinstance(commands, list) or not all(isinstance(c, str) for c in commands):
+        return 'commands must be a list of strings'
+    return None
+
 @app.route('/sui/client/call', methods=['POST'])
-def call_contract():
+async def call_contract():
     """Execute a contract call"""
     try:
-        data = request.json
+        data = await request.get_json()
+        if not isinstance(data, dict):
+            return jsonify({'success': False, 'error': 'Request body must be a JSON object'}), 400
+        
         package_id = data.get('package_id')
         module = data.get('module')
         function = data.get('function')
         args = data.get('args', [])
         type_args = data.get('type_args', [])
-        gas_budget = data.get('gas_budget', '10000000')
+        gas_budget = str(data.get('gas_budget', '10000000'))
+        
+        error = call_request_error(package_id, module, function, gas_budget, args, type_args)
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
         
-        # Build sui client call command
-        cmd = ['sui', 'client', 'call', 
+        if sui_rpc:
+            logger.info("Executing moveCall: %s::%s::%s", package_id, module, function)
+            try:
+                response = await sui_rpc.move_call(
+                    package_id, module, function, type_args,
+                    [to_sui_json(arg) for arg in args], gas_budget)
+            except SuiRpcError as e:
+                # Mirror a failed CLI invocation so callers can read stderr
+                return jsonify({
+                    'success': False,
+                    'stdout': '',
+                    'stderr': str(e),
+                    'returncode': 1
+                })
+            
+            status = response.get('effects', {}).get('status', {})
+            success = status.get('status') == 'success'
+            return jsonify({
+                'success': success,
+                'stdout': '',
+                'stdout_json': response,
+                'stderr': status.get('error', ''),
+                'returncode': 0 if success else 1
+            })
+        
+        # Build sui client call command, with type and function arguments, in one pass
+        cmd = [SUI_BIN, 'client', 'call',
                '--package', package_id,
                '--module', module,
                '--function', function,
-               '--gas-budget', gas_budget]
-        
-        # Add type arguments if provided
-        for type_arg in type_args:
-            cmd.extend(['--type-args', type_arg])
+               '--gas-budget', gas_budget,
+               '--json',
+               *chain.from_iterable(('--type-args', type_arg) for type_arg in type_args),
+               *chain.from_iterable(
+                   ('--args', arg if isinstance(arg, str) else str(arg)) for arg in args)]
         
-        # Add function arguments
-        for arg in args:
-            cmd.extend(['--args', str(arg)])
+        # Join the command line at most once, and only if it is logged or returned
+        cmd_str = ' '.join(cmd) if SUI_PROXY_DEBUG or logger.isEnabledFor(logging.INFO) else None
+        if cmd_str:
+            logger.info("Executing command: %s", cmd_str)
         
-        logger.info(f"Executing command: {' '.join(cmd)}")
+        result = await run_cli(cmd, timeout=30)
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        return jsonify({
-            'success': result.returncode == 0,
-            'stdout': result.stdout.strip(),
-            'stderr': result.stderr.strip(),
-            'returncode': result.returncode,
-            'command': ' '.join(cmd)
-        })
+        body = cli_json_body(result)
+        if SUI_PROXY_DEBUG:
+            body['command'] = cmd_str
+        return jsonify(body)
         
     except Exception as e:
         logger.error(f"Error executing contract call: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/sui/client/ptb', methods=['POST'])
-def execute_ptb():
+async def execute_ptb():
     """Execute a Programmable Transaction Block"""
     try:
-        data = request.json
+        data = await request.get_json()
+        if not isinstance(data, dict):
+            return jsonify({'success': False, 'error': 'Request body must be a JSON object'}), 400
+        
         ptb_commands = data.get('commands', [])
-        gas_budget = data.get('gas_budget', '10000000')
+        gas_budget = str(data.get('gas_budget', '10000000'))
+        
+        error = ptb_request_error(gas_budget, ptb_commands)
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
         
         # For now, we'll use a simple approach
         # In production, you might want to build the PTB more carefully
-        cmd = ['sui', 'client', 'ptb', '--gas-budget', gas_budget]
+        # (PTB commands are simplified - you may need to adjust based on your needs)
+        cmd = [SUI_BIN, 'client', 'ptb', '--json', '--gas-budget', gas_budget,
+               *chain.from_iterable(('--assign', command) for command in ptb_commands)]
         
-        # Add PTB commands (this is simplified - you may need to adjust based on your needs)
-        for command in ptb_commands:
-            cmd.extend(['--assign', command])
+        # Join the command line at most once, and only if it is logged or returned
+        cmd_str = ' '.join(cmd) if SUI_PROXY_DEBUG or logger.isEnabledFor(logging.INFO) else None
+        if cmd_str:
+            logger.info("Executing PTB command: %s", cmd_str)
         
-        logger.info(f"Executing PTB command: {' '.join(cmd)}")
+        result = await run_cli(cmd, timeout=30)
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        return jsonify({
-            'success': result.returncode == 0,
-            'stdout': result.stdout.strip(),
-            'stderr': result.stderr.strip(),
-            'returncode': result.returncode,
-            'command': ' '.join(cmd)
-        })
+        body = cli_json_body(result)
+        if SUI_PROXY_DEBUG:
+            body['command'] = cmd_str
+        return jsonify(body)
         
     except Exception as e:
         logger.error(f"Error executing PTB: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 # Government API Proxy Endpoints
+# Close tasks for dropped upstream responses, referenced until they finish
+_upstream_close_tasks = set()
+
+def _close_upstream_later(response):
+    """Schedule closing an httpx response whose relay was dropped unfinished"""
+    try:
+        task = asyncio.get_running_loop().create_task(response.aclose())
+    except RuntimeError:
+        return  # Event loop already gone; the connection pool is closing anyway
+    _upstream_close_tasks.add(task)
+    task.add_done_callback(_upstream_close_tasks.discard)
+
+class UpstreamBody:
+    """Async iterator relaying a streamed httpx response as a Quart response body.
+
+    Quart calls aclose() once sending finishes or fails. If the response is
+    dropped before Quart starts sending the body (for example the client
+    disconnects while the headers are sent), the upstream response is closed
+    when this object is garbage collected, so its pooled connection is returned.
+    """
+
+    def __init__(self, response):
+        self.response = response
+        self.chunks = response.aiter_bytes(8192)
+        self._finalizer = weakref.finalize(self, _close_upstream_later, response)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.chunks.__anext__()
+
+    async def aclose(self):
+        self._finalizer.detach()
+        await self.response.aclose()
+
+# Set ENABLE_GOVT_API=false on hosts that only proxy Sui calls
+ENABLE_GOVT_API = os.getenv('ENABLE_GOVT_API', 'true').lower() in ('1', 'true', 'yes')
+
 # JWT token cache
 jwt_token_cache = {
     'token': None,
     'expires_at': None
 }
+# Serializes token refreshes so concurrent requests trigger a single /authenticate
+_jwt_lock = asyncio.Lock()
+_jwt_refresh_task = None
+# After a failed background refresh, wait this long before trying proactively again
+JWT_REFRESH_BACKOFF = 60  # seconds
+_jwt_refresh_failed_at = None
 
-def get_govt_api_credentials():
-    """Get government API credentials from environment"""
-    api_key = os.getenv('GOVT_API_KEY')
-    api_secret = os.getenv('GOVT_API_SECRET')
-    if not api_key or not api_secret:
-        raise ValueError("GOVT_API_KEY and GOVT_API_SECRET environment variables required")
-    return api_key, api_secret
+# Government API credentials, read once after the .env file is loaded
+GOVT_API_KEY = os.getenv('GOVT_API_KEY')
+GOVT_API_SECRET = os.getenv('GOVT_API_SECRET')
+_AUTH_HEADERS = {
+    'x-api-key': GOVT_API_KEY,
+    'x-api-secret': GOVT_API_SECRET
+}
 
-def get_valid_jwt_token():
-    """Get valid JWT token, refresh if needed"""
-    global jwt_token_cache
-    
-    # Check if token is still valid (with 1 hour buffer)
-    if (jwt_token_cache['token'] and jwt_token_cache['expires_at'] and 
-        datetime.now() < jwt_token_cache['expires_at'] - timedelta(hours=1)):
+def _cached_jwt_token(buffer):
+    """Return the cached JWT token if it is valid for at least `buffer`"""
+    if (jwt_token_cache['token'] and jwt_token_cache['expires_at'] and
+        datetime.now() < jwt_token_cache['expires_at'] - buffer):
         return jwt_token_cache['token']
+    return None
+
+async def _authenticate():
+    """Authenticate with the government API and cache the new token"""
+    if not GOVT_API_KEY or not GOVT_API_SECRET:
+        raise ValueError("GOVT_API_KEY and GOVT_API_SECRET environment variables required")
     
-    # Authenticate and get new token
-    api_key, api_secret = get_govt_api_credentials()
-    
-    auth_response = requests.post(
+    auth_response = await HTTP_CLIENT.post(
         'https://api.sandbox.co.in/authenticate',
-        headers={
-            'accept': 'application/json',
-            'x-api-key': api_key,
-            'x-api-secret': api_secret
-        },
+        headers=_AUTH_HEADERS,
         timeout=30
     )
     
-    if not auth_response.ok:
+    if not auth_response.is_success:
         raise Exception(f"Authentication failed: {auth_response.status_code} - {auth_response.text}")
     
     auth_data = auth_response.json()
@@ -183,81 +479,156 @@ def get_valid_jwt_token():
     logger.info("Successfully authenticated with government API")
     return token
 
-@app.route('/govt-api/pan/verify', methods=['POST'])
-def govt_api_pan_verify():
+async def _refresh_jwt_token_in_background():
+    """Refresh a soon-to-expire JWT token without blocking requests"""
+    global _jwt_refresh_failed_at
+    
+    try:
+        async with _jwt_lock:
+            # Another request may have refreshed while we waited
+            if not _cached_jwt_token(timedelta(hours=2)):
+                await _authenticate()
+        _jwt_refresh_failed_at = None
+    except Exception as e:
+        _jwt_refresh_failed_at = time.monotonic()
+        logger.error(f"Background JWT refresh failed, retrying in {JWT_REFRESH_BACKOFF}s: {e}")
+
+async def get_valid_jwt_token():
+    """Get valid JWT token, refresh if needed"""
+    global _jwt_refresh_task
+    
+    # Fast path: token is still valid (with 1 hour buffer)
+    token = _cached_jwt_token(timedelta(hours=1))
+    if token:
+        # Within 2 hours of expiry, refresh proactively so no request waits on auth
+        if (not _cached_jwt_token(timedelta(hours=2)) and
+            (_jwt_refresh_task is None or _jwt_refresh_task.done()) and
+            (_jwt_refresh_failed_at is None or
+             time.monotonic() - _jwt_refresh_failed_at >= JWT_REFRESH_BACKOFF)):
+            _jwt_refresh_task = asyncio.create_task(_refresh_jwt_token_in_background())
+        return token
+    
+    async with _jwt_lock:
+        # Another request may have refreshed while we waited
+        token = _cached_jwt_token(timedelta(hours=1))
+        if token:
+            return token
+        return await _authenticate()
+
+async def govt_api_pan_verify():
     """Proxy PAN verification requests to government API"""
     try:
         # Get valid JWT token
-        token = get_valid_jwt_token()
+        token = await get_valid_jwt_token()
         
         # Get request data from enclave
-        request_data = request.get_json()
+        request_data = await request.get_json()
         if not request_data:
             return jsonify({"error": "No JSON data provided"}), 400
         
-        logger.info(f"Proxying PAN verification request: {request_data.get('pan', 'N/A')}")
+        logger.info("Proxying PAN verification request: %s", request_data.get('pan', 'N/A'))
         
         # Make request to government API
-        api_key, _ = get_govt_api_credentials()
-        
-        response = requests.post(
+        upstream_request = HTTP_CLIENT.build_request(
+            'POST',
             'https://api.sandbox.co.in/kyc/pan/verify',
             headers={
-                'accept': 'application/json',
                 'content-type': 'application/json',
                 'authorization': token,  # Raw JWT token
-                'x-api-key': api_key
+                'x-api-key': GOVT_API_KEY
             },
             json=request_data,
             timeout=60
         )
+        response = await HTTP_CLIENT.send(upstream_request, stream=True)
         
-        if not response.ok:
+        if not response.is_success:
+            await response.aread()
+            await response.aclose()
             logger.error(f"Government API error: {response.status_code} - {response.text}")
             return jsonify({
                 "error": f"Government API error: {response.status_code}",
                 "details": response.text
             }), response.status_code
         
-        result = response.json()
-        logger.info(f"PAN verification successful: {result.get('data', {}).get('status', 'N/A')}")
+        logger.info("PAN verification successful: HTTP %s", response.status_code)
         
-        return jsonify(result)
+        # Relay the upstream body chunk by chunk instead of buffering and re-encoding it
+        return Response(UpstreamBody(response), status=response.status_code, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error in government API proxy: {e}")
         return jsonify({"error": str(e)}), 500
 
-if __name__ == '__main__':
-    # Load environment variables from .env file
-    env_file = os.path.join(os.path.dirname(__file__), 'src', 'attestation-backend', '.env')
-    if os.path.exists(env_file):
-        load_dotenv(env_file)
-        logger.info(f"Loaded environment variables from: {env_file}")
-    else:
-        logger.warning(f"No .env file found at: {env_file}")
-    
-    # Check if sui CLI is available
+if ENABLE_GOVT_API:
+    app.route('/govt-api/pan/verify', methods=['POST'])(govt_api_pan_verify)
+
+async def check_sui_cli():
+    """Log whether the sui CLI is available"""
     try:
-        result = subprocess.run(['sui', '--version'], capture_output=True, text=True)
+        result = await run_cli([SUI_BIN, '--version'], timeout=10)
         if result.returncode == 0:
-            logger.info(f"Sui CLI available: {result.stdout.strip()}")
+            logger.info(f"Sui CLI available: {decode_output(result.stdout)}")
         else:
             logger.error("Sui CLI not available or not working")
     except Exception as e:
         logger.error(f"Error checking Sui CLI: {e}")
+
+async def init_sui_backend():
+    """Load the JSON-RPC client (unless SUI_USE_CLI) and resolve the active address"""
+    global sui_rpc
+    
+    # Load the active address and key for direct JSON-RPC calls
+    if SUI_USE_CLI:
+        logger.info("SUI_USE_CLI set, Sui calls will go through the sui CLI")
+    else:
+        try:
+            sui_rpc = SuiRpcClient.from_config(HTTP_CLIENT)
+            logger.info(f"Sui JSON-RPC enabled: {sui_rpc.rpc_url} as {sui_rpc.address}")
+        except Exception as e:
+            logger.error(f"Error loading Sui config, falling back to sui CLI: {e}")
+    
+    # Resolve the active address once; it is served from memory afterwards
+    try:
+        result = await fetch_active_address()
+        if result['success']:
+            logger.info(f"Active Sui address: {result['stdout']}")
+        else:
+            logger.error(f"Error resolving active address: {result['stderr']}")
+    except Exception as e:
+        logger.error(f"Error resolving active address: {e}")
+
+@app.before_serving
+async def startup():
+    """Log environment, Sui CLI/RPC and credential status once the server starts"""
+    if os.path.exists(ENV_FILE):
+        logger.info(f"Loaded environment variables from: {ENV_FILE}")
+    else:
+        logger.warning(f"No .env file found at: {ENV_FILE}")
+    
+    # The CLI version check and the active address lookup are independent
+    await asyncio.gather(check_sui_cli(), init_sui_backend())
     
     # Verify government API credentials are available
+    if not ENABLE_GOVT_API:
+        logger.info("Government API proxy disabled (ENABLE_GOVT_API=false)")
+        return
     try:
-        api_key = os.getenv('GOVT_API_KEY')
-        api_secret = os.getenv('GOVT_API_SECRET')
-        if api_key and api_secret:
-            logger.info(f"Government API credentials loaded: Key={api_key[:10]}..., Secret={api_secret[:10]}...")
+        if GOVT_API_KEY and GOVT_API_SECRET:
+            logger.info(f"Government API credentials loaded: Key={GOVT_API_KEY[:10]}..., Secret={GOVT_API_SECRET[:10]}...")
         else:
             logger.warning("Government API credentials not found in environment")
     except Exception as e:
         logger.error(f"Error checking government API credentials: {e}")
 
-    # Start the Flask server
+@app.after_serving
+async def shutdown():
+    """Close pooled HTTP connections"""
+    await HTTP_CLIENT.aclose()
+
+if __name__ == '__main__':
+    import uvicorn
+
+    # Single-process server for local runs; production uses gunicorn (see parent_forwarder.sh)
     logger.info("Starting Sui Proxy Service on port 9999")
-    app.run(host='0.0.0.0', port=9999, debug=False)
+    uvicorn.run(app, host='0.0.0.0', port=9999, timeout_keep_alive=75)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Sui JSON-RPC client
+Talks to the Sui fullnode directly with the Sui CLI's active address and
+keystore, so the proxy does not have to spawn the sui CLI per request
+
+Requirements: pip install httpx pyyaml cryptography
+"""
+
+import base64
+import hashlib
+import itertools
+import json
+import os
+
+import yaml
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+SUI_CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.sui', 'sui_config')
+
+# Signature scheme flag used by the keystore and serialized signatures
+ED25519_FLAG = 0x00
+# Intent prefix (scope=TransactionData, version=V0, app=Sui) signed over with tx bytes
+TRANSACTION_INTENT = bytes([0, 0, 0])
+MIST_PER_SUI = 10 ** 9
+
+class SuiRpcError(Exception):
+    """JSON-RPC error returned by the Sui fullnode"""
+
+def _reject_constant(name):
+    raise ValueError(f"{name} is not valid JSON")
+
+def to_sui_json(arg):
+    """Convert a call argument the same way `sui client call --args` parses it"""
+    if not isinstance(arg, str):
+        return arg
+    try:
+        # serde_json rejects NaN/Infinity, so the CLI keeps those as strings
+        return json.loads(arg, parse_constant=_reject_constant)
+    except ValueError:
+        return arg
+
+def gas_coin_summary(coin):
+    """Convert a suix_getCoins entry to the shape `sui client gas --json` prints"""
+    mist_balance = int(coin['balance'])
+    return {
+        'gasCoinId': coin['coinObjectId'],
+        'mistBalance': mist_balance,
+        # Same f64 division and 2-decimal rounding as the CLI's format_balance
+        'suiBalance': f"{float(mist_balance) / MIST_PER_SUI:.2f}"
+    }
+
+def _public_key_bytes(private_key):
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+
+def _ed25519_address(public_key):
+    return '0x' + hashlib.blake2b(bytes([ED25519_FLAG]) + public_key, digest_size=32).hexdigest()
+
+class SuiRpcClient:
+    """Minimal Sui JSON-RPC client signing transactions with a local Ed25519 key"""
+
+    def __init__(self, http_client, rpc_url, address, private_key):
+        self.http_client = http_client
+        self.rpc_url = rpc_url
+        self.address = address
+        self.private_key = private_key
+        self.public_key = _public_key_bytes(private_key)
+        self._ids = itertools.count(1)
+
+    @classmethod
+    def from_config(cls, http_client, config_dir=SUI_CONFIG_DIR):
+        """Load the active address, RPC URL and its key from the Sui CLI config"""
+        with open(os.path.join(config_dir, 'client.yaml')) as f:
+            config = yaml.safe_load(f)
+
+        address = config['active_address'].lower()
+        rpc_url = os.getenv('SUI_RPC_URL')
+        if not rpc_url:
+            env = next(e for e in config['envs'] if e['alias'] == config['active_env'])
+            rpc_url = env['rpc']
+
+        keystore_path = config['keystore']['File']
+        with open(keystore_path) as f:
+            keys = json.load(f)
+
+        for encoded in keys:
+            raw = base64.b64decode(encoded)
+            if raw[0] != ED25519_FLAG:
+                continue
+            private_key = Ed25519PrivateKey.from_private_bytes(raw[1:33])
+            if _ed25519_address(_public_key_bytes(private_key)) == address:
+                return cls(http_client, rpc_url, address, private_key)
+
+        raise ValueError(f"No Ed25519 key for active address {address} in {keystore_path}")
+
+    async def call(self, method, params):
+        """Send a JSON-RPC request and return its result"""
+        response = await self.http_client.post(self.rpc_url, json={
+            'jsonrpc': '2.0',
+            'id': next(self._ids),
+            'method': method,
+            'params': params
+        })
+        response.raise_for_status()
+        body = response.json()
+        if 'error' in body:
+            raise SuiRpcError(body['error'].get('message', str(body['error'])))
+        return body['result']
+
+    async def get_coins(self, coin_type='0x2::sui::SUI'):
+        """List all coins of `coin_type` owned by the active address"""
+        coins = []
+        cursor = None
+        while True:
+            page = await self.call('suix_getCoins', [self.address, coin_type, cursor, None])
+            coins.extend(page['data'])
+            if not page.get('hasNextPage'):
+                return coins
+            cursor = page['nextCursor']
+
+    def sign(self, tx_bytes):
+        """Sign base64 transaction bytes, returning a serialized Sui signature"""
+        digest = hashlib.blake2b(
+            TRANSACTION_INTENT + base64.b64decode(tx_bytes), digest_size=32).digest()
+        signature = self.private_key.sign(digest)
+        return base64.b64encode(bytes([ED25519_FLAG]) + signature + self.public_key).decode()
+
+    async def execute(self, tx_bytes):
+        """Sign and execute a transaction, waiting for local execution"""
+        return await self.call('sui_executeTransactionBlock', [
+            tx_bytes,
+            [self.sign(tx_bytes)],
+            {'showEffects': True, 'showEvents': True, 'showObjectChanges': True},
+            'WaitForLocalExecution'
+        ])
+
+    async def move_call(self, package_id, module, function, type_args, args, gas_budget):
+        """Build, sign and execute a Move call from the active address"""
+        tx = await self.call('unsafe_moveCall', [
+            self.address, package_id, module, function,
+            type_args, args, None, str(gas_budget)
+        ])
+        return await self.execute(tx['txBytes'])
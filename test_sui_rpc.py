@@ -0,0 +1,71 @@
+"""Tests for sui_rpc key loading, address derivation and signing"""
+
+import base64
+import hashlib
+import json
+
+import yaml
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from sui_rpc import SuiRpcClient, gas_coin_summary, to_sui_json
+
+# Keystore entry (flag || secret key) and address from the Sui SDK's keytool
+# test vectors (suiprivkey1qrwsjvr6gwaxmsvxk4cfun99ra8uwxg3c9pl0nhle7xxpe4s80y05ctazer)
+KEYSTORE_ENTRY = 'AN0JMHpDum3BhrVwnkylH0/HGRHBQ/fO/8+MYOawO8j6'
+ADDRESS = '0xa2d14fad60c56049ecf75246a481934691214ce413e6a8ae2fe6834c173a6133'
+
+TX_BYTES = base64.b64encode(b'sui-proxy test transaction').decode()
+SIGNATURE = (
+    'ADJezfMg8di8IuGsiza3ekBWpweOzWv0MI80M4p5LfL78fbq+VUpoNQtYYh4C7jAOi7QIj/O'
+    'ItD9iVhcfGIvowciZH/u7zYwYL1CBaFnGhXxChI2dlkYsbX2ONgvM8/EaQ=='
+)
+
+def load_client(tmp_path, keys):
+    keystore = tmp_path / 'sui.keystore'
+    keystore.write_text(json.dumps(keys))
+    (tmp_path / 'client.yaml').write_text(yaml.safe_dump({
+        'keystore': {'File': str(keystore)},
+        'envs': [{'alias': 'testnet', 'rpc': 'https://fullnode.testnet.sui.io:443'}],
+        'active_env': 'testnet',
+        'active_address': ADDRESS
+    }))
+    return SuiRpcClient.from_config(None, str(tmp_path))
+
+def test_from_config_picks_key_for_active_address(tmp_path):
+    other_key = base64.b64encode(bytes(33)).decode()
+    client = load_client(tmp_path, [other_key, KEYSTORE_ENTRY])
+    assert client.address == ADDRESS
+    assert client.rpc_url == 'https://fullnode.testnet.sui.io:443'
+
+def test_sign_produces_flag_signature_public_key(tmp_path):
+    client = load_client(tmp_path, [KEYSTORE_ENTRY])
+    serialized = client.sign(TX_BYTES)
+    assert serialized == SIGNATURE
+
+    raw = base64.b64decode(serialized)
+    assert len(raw) == 97 and raw[0] == 0
+    signature, public_key = raw[1:65], raw[65:]
+    assert public_key == client.public_key
+    digest = hashlib.blake2b(
+        bytes([0, 0, 0]) + base64.b64decode(TX_BYTES), digest_size=32).digest()
+    Ed25519PublicKey.from_public_bytes(public_key).verify(signature, digest)
+
+def test_to_sui_json_matches_cli_parsing():
+    assert to_sui_json('true') is True
+    assert to_sui_json('12') == 12
+    assert to_sui_json('[1, 2]') == [1, 2]
+    assert to_sui_json('0xab') == '0xab'
+    assert to_sui_json(7) == 7
+    for constant in ('NaN', 'Infinity', '-Infinity'):
+        assert to_sui_json(constant) == constant
+
+def test_gas_coin_summary_formats_sui_balance_like_cli():
+    def summary(balance):
+        return gas_coin_summary({'coinObjectId': '0x1', 'balance': balance, 'version': '3'})
+
+    assert summary('1500000000') == {
+        'gasCoinId': '0x1', 'mistBalance': 1500000000, 'suiBalance': '1.50'}
+    # Sub-0.01 SUI coins stay plain decimals, never scientific notation
+    assert summary('123')['suiBalance'] == '0.00'
+    assert summary('1')['suiBalance'] == '0.00'
+    assert summary('9000000')['suiBalance'] == '0.01'